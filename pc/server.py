@@ -1,13 +1,15 @@
 import argparse
 import contextlib
-import queue
+import os
+import re
+import selectors
 import socket
 import struct
 import sys
 import threading
 import time
-import wave
 
+import numpy as np
 import sounddevice as sd
 
 try:
@@ -15,12 +17,27 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     sc = None
 
+try:
+    from numba import njit
+except Exception:  # pragma: no cover - optional dependency
+    njit = None
+
 MAGIC = b"PCM1"
+MULAW_MAGIC = b"PCM2"  # same header layout, 8-bit G.711 mu-law samples
 MIC_MAGIC = b"MIC1"
+HEADER_STRUCT = struct.Struct("<4sIHHI")  # magic, samplerate, channels, bits, block_frames
+WAV_HEADER_STRUCT = struct.Struct("<4sI4s4sIHHIIHH4sI")  # 44-byte PCM RIFF/WAVE header
 DEFAULT_SAMPLE_RATE = 48000
 DEFAULT_CHANNELS = 2
 DEFAULT_BLOCK_FRAMES = 960  # 20 ms @ 48 kHz
 DEFAULT_MIC_PORT = 5001
+DEFAULT_SEND_BATCH = 4  # max ring blocks handed to one _StreamClient.offer() when behind
+DEFAULT_SEND_BUFFER = 131072
+MIC_RECV_BUFFER = 65536
+TCP_KEEPALIVE_IDLE = 2  # seconds without traffic before the first probe
+TCP_KEEPALIVE_INTERVAL = 1
+TCP_KEEPALIVE_COUNT = 3
+TCP_USER_TIMEOUT_MS = 5000  # unacknowledged data before the socket is dropped (Linux)
 LOOPBACK_KEYWORDS = (
     "mezcla estereo",
     "stereo mix",
@@ -37,6 +54,28 @@ PREFERRED_MIC_OUTPUT_HINTS = (
     "vb-audio virtual c",
     "vb-audio virtual cable",
 )
+# (hints, weight): weight is added once when any hint appears in the lowercased name.
+MIC_OUTPUT_NAME_SCORES = (
+    (("cable input",), 180),
+    (("vb-audio", "virtual cable"), 100),
+    # Avoid picking the wrong endpoint when both CABLE Input/Output exist.
+    (("cable output",), -160),
+    (("16ch",), -20),
+)
+MIC_OUTPUT_HOSTAPI_SCORES = ((("mme",), 40),)
+_TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+_MSG_MORE = getattr(socket, "MSG_MORE", 0)
+_LOOPBACK_RE = re.compile("|".join(map(re.escape, LOOPBACK_KEYWORDS)), re.IGNORECASE)
+_VB_CABLE_RE = re.compile("|".join(map(re.escape, VB_CABLE_HINTS)), re.IGNORECASE)
+DEVICE_CACHE_TTL = 3.0  # seconds; WASAPI/PortAudio enumeration is slow
+MIC_CACHE_TTL = 5.0
+
+_device_cache: dict[str, object] = {"ts": 0.0, "devices": None, "hostapis": None, "named": None}
+_mic_cache: dict[str, object] = {"ts": 0.0, "mics": None}
+_NUMPY_OK_FOR_SOUNDCARD = int(np.__version__.split(".")[0]) < 2
+_pcm_scratch = np.empty(0, dtype=np.float32)
+_pcm_out = np.empty(0, dtype=np.int16)
+_mulaw_table: np.ndarray | None = None
 
 
 def _normalize_name(name: str) -> str:
@@ -44,14 +83,64 @@ def _normalize_name(name: str) -> str:
 
 
 def _is_virtual_cable_name(name: str) -> bool:
-    lowered = name.lower()
-    return any(hint in lowered for hint in VB_CABLE_HINTS)
+    return _VB_CABLE_RE.search(name) is not None
+
+
+def _refresh_device_cache() -> None:
+    now = time.monotonic()
+    if _device_cache["devices"] is None or now - _device_cache["ts"] > DEVICE_CACHE_TTL:
+        devices = sd.query_devices()
+        _device_cache["devices"] = devices
+        _device_cache["hostapis"] = sd.query_hostapis()
+        _device_cache["named"] = [(dev, dev["name"].lower()) for dev in devices]
+        _device_cache["ts"] = now
+
+
+def reset_audio_devices() -> None:
+    # PortAudio snapshots the device list in Pa_Initialize (run when
+    # sounddevice is imported), so a long-lived process must re-initialize it
+    # to see devices added since, e.g. a freshly installed VB-CABLE.
+    sd._terminate()
+    sd._initialize()
+    _device_cache["devices"] = None
+    _mic_cache["mics"] = None
+
+
+def cached_devices():
+    _refresh_device_cache()
+    return _device_cache["devices"]
+
+
+def cached_device(index: int):
+    devices = cached_devices()
+    if index < 0 or index >= len(devices):
+        raise RuntimeError(f"Indice de dispositivo fuera de rango: {index}")
+    return devices[index]
+
+
+def default_output_index() -> int | None:
+    # PortAudio reports "no default output" as -1.
+    index = sd.default.device[1]
+    if index is None or index < 0:
+        return None
+    return index
+
+
+def cached_named_devices() -> list[tuple[dict, str]]:
+    # (device, lowercased name) pairs, so scans do not re-lower every name.
+    _refresh_device_cache()
+    return _device_cache["named"]
+
+
+def hostapi_name(index: int) -> str:
+    _refresh_device_cache()
+    return _device_cache["hostapis"][index]["name"]
 
 
 def list_sounddevice_devices() -> None:
-    devices = sd.query_devices()
+    devices = cached_devices()
     for idx, dev in enumerate(devices):
-        hostapi = sd.query_hostapis(dev["hostapi"])["name"]
+        hostapi = hostapi_name(dev["hostapi"])
         directions = []
         if dev["max_input_channels"] > 0:
             directions.append("in")
@@ -61,11 +150,19 @@ def list_sounddevice_devices() -> None:
         print(f"{idx}: {dev['name']} [{hostapi}] ({direction})")
 
 
+def cached_microphones() -> list:
+    now = time.monotonic()
+    if _mic_cache["mics"] is None or now - _mic_cache["ts"] > MIC_CACHE_TTL:
+        _mic_cache["mics"] = sc.all_microphones(include_loopback=True)
+        _mic_cache["ts"] = now
+    return _mic_cache["mics"]
+
+
 def list_soundcard_devices() -> None:
     if sc is None:
         print("soundcard no esta instalado.")
         return
-    microphones = sc.all_microphones(include_loopback=True)
+    microphones = cached_microphones()
     if not microphones:
         print("No se encontraron microfonos con soundcard.")
         return
@@ -76,41 +173,271 @@ def list_soundcard_devices() -> None:
 
 
 def list_output_devices() -> None:
-    devices = sd.query_devices()
+    devices = cached_devices()
     for idx, dev in enumerate(devices):
         if dev["max_output_channels"] <= 0:
             continue
-        hostapi = sd.query_hostapis(dev["hostapi"])["name"]
+        hostapi = hostapi_name(dev["hostapi"])
         print(f"{idx}: {dev['name']} [{hostapi}] (out)")
 
 
-def clear_queue(q: "queue.Queue[bytes]") -> None:
-    try:
-        while True:
-            q.get_nowait()
-    except queue.Empty:
-        return
-
-
 def configure_tcp_keepalive(sock: socket.socket) -> None:
     with contextlib.suppress(OSError):
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-    # Windows-specific keepalive tuning (on, idle_ms, interval_ms).
+    # Windows tuning (on, idle_ms, interval_ms), from the same constants as the
+    # options below; set first so TCP_KEEPCNT, where supported, still applies.
     if hasattr(socket, "SIO_KEEPALIVE_VALS"):
         with contextlib.suppress(OSError):
-            sock.ioctl(socket.SIO_KEEPALIVE_VALS, (1, 15000, 5000))
+            sock.ioctl(
+                socket.SIO_KEEPALIVE_VALS,
+                (1, TCP_KEEPALIVE_IDLE * 1000, TCP_KEEPALIVE_INTERVAL * 1000),
+            )
+    # Probe an idle client after a couple of seconds instead of the ~2 h
+    # default. Linux also gets TCP_USER_TIMEOUT, which drops a client that stops
+    # acknowledging streamed data within seconds; Windows lacks that option and
+    # falls back to its own retransmission timeout while data is in flight.
+    for name, value in (
+        ("TCP_KEEPIDLE", TCP_KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", TCP_KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", TCP_KEEPALIVE_COUNT),
+        ("TCP_USER_TIMEOUT", TCP_USER_TIMEOUT_MS),
+    ):
+        option = getattr(socket, name, None)
+        if option is not None:
+            with contextlib.suppress(OSError):
+                sock.setsockopt(socket.IPPROTO_TCP, option, value)
+
+
+def apply_realtime_priority(cpu: int | None) -> None:
+    # Applies to the calling thread only: on Linux pid 0 means "this thread"
+    # for both calls, and the Windows path uses the current thread handle.
+    if sys.platform == "win32":
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetCurrentThread()
+        if cpu is not None and not kernel32.SetThreadAffinityMask(handle, 1 << cpu):
+            print(f"No se pudo fijar la CPU {cpu}.", file=sys.stderr)
+        if not kernel32.SetThreadPriority(handle, 15):  # THREAD_PRIORITY_TIME_CRITICAL
+            print("No se pudo subir la prioridad del hilo.", file=sys.stderr)
+        return
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError as exc:
+            print(f"No se pudo fijar la CPU {cpu}: {exc}", file=sys.stderr)
+    if hasattr(os, "sched_setscheduler"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        except OSError as exc:
+            print(f"SCHED_FIFO no disponible (requiere root/CAP_SYS_NICE): {exc}", file=sys.stderr)
+
+
+def rearm_quickack(sock: socket.socket) -> None:
+    # Linux only: ACK incoming data immediately. The kernel falls back to
+    # delayed ACKs on its own, so receivers re-arm this after each read.
+    if _TCP_QUICKACK is not None:
+        with contextlib.suppress(OSError):
+            sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+
+
+def configure_stream_socket(conn: socket.socket, nodelay: bool, sndbuf: int) -> None:
+    if nodelay:
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if sndbuf > 0:
+        with contextlib.suppress(OSError):
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+    configure_tcp_keepalive(conn)
+
+
+def coalesce_flags(send_index: int, coalesce: int) -> int:
+    # With --coalesce N, all but every Nth send carry MSG_MORE so the kernel
+    # packs N blocks per segment (Linux; elsewhere MSG_MORE is 0).
+    return _MSG_MORE if send_index % coalesce else 0
+
+
+class _BlockRing:
+    # Single-producer/single-consumer ring of preallocated blocks. The audio
+    # callback only advances `_head` and the consumer only advances `_tail`,
+    # so moving data never takes a lock (int stores are atomic under the GIL).
+    # The condition is used for wakeups only, and the producer never blocks
+    # on it: a missed notify just lets the consumer's timed wait expire.
+
+    def __init__(self, slots: int, block_bytes: int) -> None:
+        # Copy through memoryviews: `bytearray[:] = obj` first duplicates any
+        # non-bytearray source, while a view slice assignment is one memcpy.
+        self._views = [memoryview(bytearray(block_bytes)) for _ in range(slots)]
+        self._lengths = [0] * slots
+        self._head = 0
+        self._tail = 0
+        self._ready = threading.Condition()
+
+    def push(self, data) -> bool:
+        head = self._head
+        if head - self._tail >= len(self._views):
+            return False  # full: drop this block, the consumer owns the rest
+        slot = head % len(self._views)
+        size = len(data)
+        if size > len(self._views[slot]):
+            return False
+        self._views[slot][:size] = data
+        self._lengths[slot] = size
+        self._head = head + 1
+        if self._ready.acquire(blocking=False):
+            self._ready.notify()
+            self._ready.release()
+        return True
+
+    def peek(self, limit: int) -> list[memoryview]:
+        tail = self._tail
+        count = min(self._head - tail, limit)
+        slots = [(tail + i) % len(self._views) for i in range(count)]
+        return [self._views[slot][: self._lengths[slot]] for slot in slots]
+
+    def empty(self) -> bool:
+        return self._head == self._tail
+
+    def release(self, count: int) -> None:
+        self._tail += count
+
+    def clear(self) -> None:
+        self._tail = self._head
+
+    def wait(self, timeout: float) -> None:
+        with self._ready:
+            if self._head == self._tail:
+                self._ready.wait(timeout)
+
+
+class _StreamClient:
+    # One listener of the sounddevice fan-out. The socket is non-blocking:
+    # whatever the kernel does not take right away is kept in `pending` and
+    # goes out ahead of the next blocks. A client that falls more than
+    # `max_backlog` bytes behind is dropped instead of stalling the others.
+
+    def __init__(self, conn: socket.socket, addr, header: bytes, max_backlog: int) -> None:
+        self.conn = conn
+        self.addr = addr
+        # The header rides along with the first audio blocks.
+        self.pending = bytearray(header)
+        self.max_backlog = max_backlog
+
+    def offer(self, blocks: list, flags: int = 0) -> bool:
+        # Pending bytes (the header on the first call) and the batch of ring
+        # blocks leave in one gather sendmsg; Windows has no sendmsg, so they
+        # are joined into a single send there.
+        buffers = [self.pending, *blocks] if self.pending else blocks
+        total = sum(len(buf) for buf in buffers)
+        try:
+            if len(buffers) == 1 or not hasattr(self.conn, "sendmsg"):
+                sent = self.conn.send(b"".join(buffers) if len(buffers) > 1 else buffers[0], flags)
+            else:
+                sent = self.conn.sendmsg(buffers, (), flags)
+        except BlockingIOError:
+            sent = 0
+        if sent == total:
+            self.pending.clear()
+            return True
+        rest = bytearray()
+        for buf in buffers:
+            if sent >= len(buf):
+                sent -= len(buf)
+                continue
+            rest += memoryview(buf)[sent:]
+            sent = 0
+        self.pending = rest
+        return len(rest) <= self.max_backlog
+
+    def send_now(self, data) -> bool:
+        # Only called from the audio callback while the ring is empty, so the
+        # consumer is not inside offer() and `pending` is free to touch.
+        try:
+            sent = self.conn.send(data)
+        except OSError:
+            return False
+        if sent < len(data):
+            self.pending += memoryview(data).cast("B")[sent:]
+        return True
+
+    def close(self) -> None:
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+
+
+class _BackgroundSender:
+    # Double buffer between a capture loop and a writer thread: the producer
+    # appends into `_filling`, the writer swaps it with its own buffer and
+    # sends everything gathered since its last send. A slow client blocks the
+    # writer only, never the capture loop.
+
+    def __init__(
+        self,
+        conn: socket.socket,
+        prefix: bytes,
+        max_backlog: int,
+        drop_unit: int,
+        coalesce: int = 1,
+    ) -> None:
+        self._conn = conn
+        self._coalesce = coalesce
+        self._filling = bytearray(prefix)
+        self._keep = len(prefix)  # prefix bytes must never be dropped
+        self._max_backlog = max_backlog
+        self._drop_unit = drop_unit
+        self._ready = threading.Condition()
+        self._closed = False
+        self._failed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def push(self, payload: bytes) -> None:
+        if self._failed:
+            raise ConnectionResetError("envio interrumpido")
+        with self._ready:
+            self._filling += payload
+            excess = len(self._filling) - self._keep - self._max_backlog
+            if excess > 0:
+                # Drop the oldest whole blocks when the client falls behind.
+                drop = -(-excess // self._drop_unit) * self._drop_unit
+                del self._filling[self._keep : self._keep + drop]
+            self._ready.notify()
+
+    def close(self) -> None:
+        with self._ready:
+            self._closed = True
+            self._ready.notify()
+
+    def _run(self) -> None:
+        sending = bytearray()
+        sends = 0
+        try:
+            while True:
+                with self._ready:
+                    while not self._filling and not self._closed:
+                        self._ready.wait()
+                    if self._closed:
+                        return
+                    self._filling, sending = sending, self._filling
+                    self._keep = 0
+                sends += 1
+                self._conn.sendall(sending, coalesce_flags(sends, self._coalesce))
+                sending.clear()
+        except OSError:
+            self._failed = True
 
 
 def read_exact(conn: socket.socket, size: int) -> bytes | None:
-    chunks: list[bytes] = []
-    remaining = size
-    while remaining > 0:
-        data = conn.recv(remaining)
-        if not data:
+    buf = bytearray(size)
+    view = memoryview(buf)
+    offset = 0
+    while offset < size:
+        received = conn.recv_into(view[offset:])
+        if not received:
             return None
-        chunks.append(data)
-        remaining -= len(data)
-    return b"".join(chunks)
+        offset += received
+    return bytes(buf)
 
 
 def wasapi_loopback_supported() -> bool:
@@ -124,12 +451,10 @@ def wasapi_loopback_supported() -> bool:
 
 
 def find_loopback_device() -> int | None:
-    devices = sd.query_devices()
-    for dev in devices:
+    for dev, name in cached_named_devices():
         if dev["max_input_channels"] <= 0:
             continue
-        name = dev["name"].lower()
-        if any(keyword in name for keyword in LOOPBACK_KEYWORDS):
+        if _LOOPBACK_RE.search(name):
             return dev["index"]
     return None
 
@@ -141,8 +466,8 @@ def resolve_backend(choice: str) -> str:
 
 
 def describe_sounddevice(device: int) -> None:
-    dev = sd.query_devices(device)
-    hostapi = sd.query_hostapis(dev["hostapi"])["name"]
+    dev = cached_device(device)
+    hostapi = hostapi_name(dev["hostapi"])
     print(f"Usando dispositivo: {device} - {dev['name']} [{hostapi}]")
 
 
@@ -152,7 +477,7 @@ def resolve_sounddevice_device(device_arg: int | None) -> tuple[int, object | No
     if loopback_ok:
         extra = sd.WasapiSettings(loopback=True)
         if device_arg is None:
-            default_output = sd.default.device[1]
+            default_output = default_output_index()
             if default_output is None:
                 raise RuntimeError("No se encontro dispositivo de salida por defecto.")
             device = default_output
@@ -174,7 +499,7 @@ def resolve_sounddevice_device(device_arg: int | None) -> tuple[int, object | No
 def resolve_soundcard_mic(device_arg: int | None):
     if sc is None:
         raise RuntimeError("soundcard no esta instalado.")
-    microphones = sc.all_microphones(include_loopback=True)
+    microphones = cached_microphones()
     if not microphones:
         raise RuntimeError("No se encontraron microfonos con soundcard.")
     if device_arg is None:
@@ -185,9 +510,9 @@ def resolve_soundcard_mic(device_arg: int | None):
             mic = None
             # Prefer loopback that matches current Windows default output.
             try:
-                default_output = sd.default.device[1]
+                default_output = default_output_index()
                 if default_output is not None:
-                    default_name = _normalize_name(sd.query_devices(default_output)["name"])
+                    default_name = _normalize_name(cached_device(default_output)["name"])
                     for candidate in loopbacks:
                         candidate_name = _normalize_name(candidate.name)
                         if default_name and (default_name in candidate_name or candidate_name in default_name):
@@ -207,40 +532,38 @@ def resolve_soundcard_mic(device_arg: int | None):
     return mic
 
 
+def _score_mic_output(name: str, hostapi: str) -> int:
+    score = 0
+    # Strong preference requested: "CABLE Input (VB-Audio Virtual C [MME] (out)".
+    if all(hint in name for hint in PREFERRED_MIC_OUTPUT_HINTS):
+        score += 250
+    for hints, weight in MIC_OUTPUT_NAME_SCORES:
+        if any(hint in name for hint in hints):
+            score += weight
+    for hints, weight in MIC_OUTPUT_HOSTAPI_SCORES:
+        if any(hint in hostapi for hint in hints):
+            score += weight
+    return score
+
+
 def resolve_mic_output_device(device_arg: int | None) -> int:
-    devices = sd.query_devices()
+    devices = cached_devices()
 
     if device_arg is not None:
-        dev = sd.query_devices(device_arg)
+        dev = cached_device(device_arg)
         if dev["max_output_channels"] <= 0:
             raise RuntimeError("El dispositivo de salida para microfono no tiene canales de salida.")
         return device_arg
 
     output_candidates = []
-    for dev in devices:
+    hostapis: dict[int, str] = {}
+    for dev, name in cached_named_devices():
         if dev["max_output_channels"] <= 0:
             continue
-        hostapi_name = sd.query_hostapis(dev["hostapi"])["name"].lower()
-        name = dev["name"].lower()
-        score = 0
-
-        # Strong preference requested: "CABLE Input (VB-Audio Virtual C [MME] (out)".
-        if all(hint in name for hint in PREFERRED_MIC_OUTPUT_HINTS):
-            score += 250
-        if "cable input" in name:
-            score += 180
-        if "vb-audio" in name or "virtual cable" in name:
-            score += 100
-        if "mme" in hostapi_name:
-            score += 40
-
-        # Avoid picking the wrong endpoint when both CABLE Input/Output exist.
-        if "cable output" in name:
-            score -= 160
-        if "16ch" in name:
-            score -= 20
-
-        output_candidates.append((score, dev["index"]))
+        hostapi = hostapis.get(dev["hostapi"])
+        if hostapi is None:
+            hostapi = hostapis[dev["hostapi"]] = hostapi_name(dev["hostapi"]).lower()
+        output_candidates.append((_score_mic_output(name, hostapi), dev["index"]))
 
     if output_candidates:
         output_candidates.sort(reverse=True)
@@ -248,9 +571,9 @@ def resolve_mic_output_device(device_arg: int | None) -> int:
         if best_score > 0:
             return best_index
 
-    default_out = sd.default.device[1]
+    default_out = default_output_index()
     if default_out is not None:
-        default_dev = sd.query_devices(default_out)
+        default_dev = cached_device(default_out)
         if default_dev["max_output_channels"] > 0:
             return default_out
 
@@ -262,51 +585,132 @@ def resolve_mic_output_device(device_arg: int | None) -> int:
 
 
 def describe_output_device(device: int, label: str) -> None:
-    dev = sd.query_devices(device)
-    hostapi = sd.query_hostapis(dev["hostapi"])["name"]
+    dev = cached_device(device)
+    hostapi = hostapi_name(dev["hostapi"])
     print(f"{label}: {device} - {dev['name']} [{hostapi}]")
 
 
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _f32_to_i16(src, dst):  # pragma: no cover - compiled by numba
+        scale = np.float32(32767.0)
+        for i in range(src.size):
+            value = src[i] * scale
+            if value > scale:
+                value = scale
+            elif value < -scale:
+                value = -scale
+            dst[i] = np.int16(value)
+
+    @njit(cache=True)
+    def _mono_to_stereo(src, dst):  # pragma: no cover - compiled by numba
+        for i in range(src.size):
+            dst[2 * i] = src[i]
+            dst[2 * i + 1] = src[i]
+
+else:
+    _f32_to_i16 = None
+    _mono_to_stereo = None
+
+
 def mono16_to_stereo(data: bytes) -> bytes:
     if not data:
         return data
-    if len(data) % 2:
-        data = data[:-1]
-    out = bytearray(len(data) * 2)
-    j = 0
-    for i in range(0, len(data), 2):
-        lo = data[i]
-        hi = data[i + 1]
-        out[j] = lo
-        out[j + 1] = hi
-        out[j + 2] = lo
-        out[j + 3] = hi
-        j += 4
-    return bytes(out)
+    samples = np.frombuffer(data, dtype=np.int16, count=len(data) // 2)
+    if _mono_to_stereo is not None:
+        stereo = np.empty(samples.size * 2, dtype=np.int16)
+        _mono_to_stereo(samples, stereo)
+        return stereo.tobytes()
+    stereo = np.empty((samples.size, 2), dtype=np.int16)
+    stereo[:, 0] = samples
+    stereo[:, 1] = samples
+    return stereo.tobytes()
+
+
+def wav_header(samplerate: int, channels: int, data_size: int) -> bytes:
+    block_align = channels * 2
+    return WAV_HEADER_STRUCT.pack(
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        channels,
+        samplerate,
+        samplerate * block_align,
+        block_align,
+        16,
+        b"data",
+        data_size,
+    )
 
 
 def write_wav(path: str, samplerate: int, channels: int, data: bytes) -> None:
-    with wave.open(path, "wb") as wav:
-        wav.setnchannels(channels)
-        wav.setsampwidth(2)
-        wav.setframerate(samplerate)
-        wav.writeframes(data)
+    with open(path, "wb") as fh:
+        fh.write(wav_header(samplerate, channels, len(data)))
+        fh.write(data)
+
+
+def pcm16_view(data) -> memoryview:
+    # Converts into the module-level int16 buffer, so the capture loop does not
+    # allocate per block. The view is only valid until the next conversion.
+    global _pcm_scratch, _pcm_out
+    arr = np.asarray(data, dtype=np.float32)
+    if _pcm_out.size < arr.size:
+        _pcm_out = np.empty(arr.size, dtype=np.int16)
+    out = _pcm_out[: arr.size]
+    if _f32_to_i16 is not None:
+        _f32_to_i16(np.ascontiguousarray(arr).reshape(-1), out)
+        return memoryview(out).cast("B")
+    # Block sizes can vary (e.g. the tail of a test recording); grow the
+    # scratch buffer once and reuse a view so clip + scale run in place.
+    if _pcm_scratch.size < arr.size:
+        _pcm_scratch = np.empty(arr.size, dtype=np.float32)
+    scratch = _pcm_scratch[: arr.size].reshape(arr.shape)
+    # minimum/maximum are plain ufuncs; np.clip adds Python-level dispatch
+    # overhead that dominates on 20 ms blocks.
+    np.minimum(arr, 1.0, out=scratch)
+    np.maximum(scratch, -1.0, out=scratch)
+    np.multiply(scratch, 32767.0, out=scratch)
+    np.copyto(out.reshape(arr.shape), scratch, casting="unsafe")
+    return memoryview(out).cast("B")
 
 
 def float_to_pcm16(data) -> bytes:
-    import numpy as np
+    return bytes(pcm16_view(data))
 
-    arr = np.asarray(data, dtype=np.float32)
-    arr = np.clip(arr, -1.0, 1.0)
-    pcm = (arr * 32767.0).astype("<i2")
-    return pcm.tobytes()
 
+def _mulaw_lut() -> np.ndarray:
+    # G.711 mu-law code for every int16 sample, indexed by its uint16 bit
+    # pattern, so encoding a block is a single gather.
+    global _mulaw_table
+    if _mulaw_table is None:
+        # Same 14-bit segment arithmetic as the reference G.711 encoder.
+        samples = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2
+        mask = np.where(samples < 0, 0x7F, 0xFF)
+        magnitude = np.minimum(np.minimum(np.abs(samples), 8159) + 0x21, 0x1FFF)
+        segment = np.frexp(magnitude >> 5)[1] - 1
+        code = (segment << 4) | ((magnitude >> (segment + 1)) & 0x0F)
+        _mulaw_table = (code ^ mask).astype(np.uint8)
+    return _mulaw_table
 
-def soundcard_numpy_guard() -> None:
-    import numpy as np
 
-    major = int(np.__version__.split(".")[0])
-    if major >= 2:
+def pcm16_to_mulaw(data) -> memoryview:
+    return memoryview(_mulaw_lut()[np.frombuffer(data, dtype="<u2")])
+
+
+def warm_up_pcm_kernels(block_frames: int, channels: int) -> None:
+    # Numba compiles (or loads from cache) on first call; do it before a client
+    # connects so the first audio blocks are not delayed by JIT work. Also sizes
+    # the scratch buffers for the configured block.
+    float_to_pcm16(np.zeros((block_frames, channels), dtype=np.float32))
+    mono16_to_stereo(bytes(block_frames * 2))
+
+
+def soundcard_numpy_guard() -> None:
+    if not _NUMPY_OK_FOR_SOUNDCARD:
         raise RuntimeError(
             "soundcard no es compatible con numpy 2.x. "
             "Instala numpy < 2.0 (ej. pip install 'numpy<2.0')."
@@ -314,24 +718,49 @@ def soundcard_numpy_guard() -> None:
 
 
 def record_test_sounddevice(args, device: int, extra, outfile: str) -> None:
-    frames = int(args.samplerate * args.test_record)
-    data = sd.rec(
-        frames=frames,
-        samplerate=args.samplerate,
-        channels=args.channels,
-        dtype="int16",
-        device=device,
-        blocking=True,
-        extra_settings=extra,
-    )
-    write_wav(outfile, args.samplerate, args.channels, data.tobytes())
+    frame_bytes = args.channels * 2
+    total = int(args.samplerate * args.test_record) * frame_bytes
+    done = threading.Event()
+    written = 0
+
+    # Write each block straight to disk so memory stays at one block however
+    # long the recording is; the header sizes are patched once it finishes.
+    with open(outfile, "wb") as fh:
+        fh.write(wav_header(args.samplerate, args.channels, 0))
+
+        def callback(indata, frames, time_info, status):
+            nonlocal written
+            if done.is_set():
+                return
+            chunk = memoryview(indata).cast("B")[: total - written]
+            fh.write(chunk)
+            written += len(chunk)
+            if written >= total:
+                done.set()
+
+        with sd.RawInputStream(
+            samplerate=args.samplerate,
+            channels=args.channels,
+            dtype="int16",
+            device=device,
+            blocksize=args.block_frames,
+            extra_settings=extra,
+            callback=callback,
+        ):
+            done.wait(args.test_record + 2.0)
+        done.set()
+        fh.seek(0)
+        fh.write(wav_header(args.samplerate, args.channels, written))
 
 
 def record_test_soundcard(args, mic, outfile: str) -> None:
     soundcard_numpy_guard()
     total_frames = int(args.samplerate * args.test_record)
     remaining = total_frames
-    blocks: list[bytes] = []
+    # Convert each block straight into its slot of one preallocated buffer.
+    pcm = bytearray(total_frames * args.channels * 2)
+    view = memoryview(pcm)
+    offset = 0
     with mic.recorder(
         samplerate=args.samplerate,
         channels=args.channels,
@@ -339,30 +768,36 @@ def record_test_soundcard(args, mic, outfile: str) -> None:
     ) as rec:
         while remaining > 0:
             count = min(args.block_frames, remaining)
-            data = rec.record(count)
-            blocks.append(float_to_pcm16(data))
+            block = pcm16_view(rec.record(count))
+            view[offset : offset + len(block)] = block
+            offset += len(block)
             remaining -= count
-    write_wav(outfile, args.samplerate, args.channels, b"".join(blocks))
+    write_wav(outfile, args.samplerate, args.channels, view[:offset])
+
+
+def stream_header(args) -> bytes:
+    if args.codec == "mulaw":
+        return HEADER_STRUCT.pack(MULAW_MAGIC, args.samplerate, args.channels, 8, args.block_frames)
+    return HEADER_STRUCT.pack(MAGIC, args.samplerate, args.channels, 16, args.block_frames)
 
 
 def stream_sounddevice(args, device: int, extra) -> None:
-    q: "queue.Queue[bytes]" = queue.Queue(maxsize=64)
+    ring = _BlockRing(64, args.block_frames * args.channels * 2)
+    block_seconds = args.block_frames / float(args.samplerate)
+
+    mulaw = args.codec == "mulaw"
+    inline_client: _StreamClient | None = None
 
     def callback(indata, _frames, _time, status) -> None:
         if status:
             print(status, file=sys.stderr)
-        data = bytes(indata)
-        try:
-            q.put_nowait(data)
-        except queue.Full:
-            try:
-                q.get_nowait()
-            except queue.Empty:
-                pass
-            try:
-                q.put_nowait(data)
-            except queue.Full:
-                pass
+        # --inline-send: with a single caught-up client and nothing queued,
+        # send from the callback itself; anything else goes through the ring.
+        client = inline_client
+        if client is not None and not client.pending and ring.empty():
+            if client.send_now(pcm16_to_mulaw(indata) if mulaw else indata):
+                return
+        ring.push(indata)
 
     stream = sd.RawInputStream(
         samplerate=args.samplerate,
@@ -374,91 +809,148 @@ def stream_sounddevice(args, device: int, extra) -> None:
         extra_settings=extra,
     )
 
-    header = struct.pack(
-        "<4sIHHI",
-        MAGIC,
-        args.samplerate,
-        args.channels,
-        16,
-        args.block_frames,
-    )
+    header = stream_header(args)
+    if mulaw:
+        _mulaw_lut()
+    max_backlog = 64 * args.block_frames * args.channels * (1 if mulaw else 2)
+    clients: dict[socket.socket, _StreamClient] = {}
+    sel = selectors.DefaultSelector()
+
+    def update_inline_client() -> None:
+        nonlocal inline_client
+        only = len(clients) == 1 and args.inline_send
+        inline_client = next(iter(clients.values())) if only else None
+
+    def drop(client: _StreamClient, reason: str = "") -> None:
+        sel.unregister(client.conn)
+        del clients[client.conn]
+        update_inline_client()
+        client.close()
+        print(f"Cliente desconectado: {client.addr[0]}:{client.addr[1]}{reason}")
 
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
         server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if not args.no_nodelay:
+            # Accepted sockets inherit TCP_NODELAY, so even the first send skips Nagle.
+            server.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         server.bind((args.host, args.port))
-        server.listen(1)
+        server.listen(4)
+        server.setblocking(False)
+        sel.register(server, selectors.EVENT_READ)
         print(f"Escuchando en {args.host}:{args.port}")
 
-        with stream:
+        if args.rt:
+            apply_realtime_priority(args.rt_cpu)
+        # One capture stream fans out to every connected client; new clients
+        # join without restarting it.
+        with stream, sel:
+            sends = 0
             while True:
-                conn, addr = server.accept()
-                print(f"Cliente conectado: {addr[0]}:{addr[1]}")
-                clear_queue(q)
-                try:
-                    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-                    configure_tcp_keepalive(conn)
-                    conn.sendall(header)
-                    while True:
-                        data = q.get()
-                        if not data:
+                # Idle until someone connects; while streaming, only poll.
+                for key, _ in sel.select(0 if clients else None):
+                    if key.fileobj is server:
+                        try:
+                            conn, addr = server.accept()
+                        except OSError:
                             continue
-                        conn.sendall(data)
-                except (BrokenPipeError, ConnectionResetError, OSError):
-                    print("Cliente desconectado")
-                finally:
+                        print(f"Cliente conectado: {addr[0]}:{addr[1]}")
+                        try:
+                            configure_stream_socket(conn, not args.no_nodelay, args.sndbuf)
+                            conn.setblocking(False)
+                        except OSError:
+                            conn.close()
+                            continue
+                        if not clients:
+                            ring.clear()
+                        clients[conn] = _StreamClient(conn, addr, header, max_backlog)
+                        sel.register(conn, selectors.EVENT_READ, clients[conn])
+                        update_inline_client()
+                        continue
+                    # The app never writes on this socket: readable means EOF or reset.
+                    try:
+                        gone = not key.fileobj.recv(4096)
+                    except BlockingIOError:
+                        gone = False
+                    except OSError:
+                        gone = True
+                    if gone:
+                        drop(key.data)
+                if not clients:
+                    continue
+                # Coalesce blocks that are already waiting so a backlog
+                # drains in fewer syscalls without delaying fresh audio.
+                blocks = ring.peek(args.send_batch)
+                if not blocks:
+                    ring.wait(block_seconds)
+                    continue
+                count = len(blocks)
+                if mulaw:
+                    # Encode once per batch; every client gets the same bytes.
+                    blocks = [pcm16_to_mulaw(block) for block in blocks]
+                sends += 1
+                flags = coalesce_flags(sends, args.coalesce)
+                for client in list(clients.values()):
                     try:
-                        conn.close()
+                        if not client.offer(blocks, flags):
+                            drop(client, " (demasiado atrasado)")
                     except OSError:
-                        pass
+                        drop(client)
+                ring.release(count)
 
 
 def stream_soundcard(args, mic) -> None:
     soundcard_numpy_guard()
-    header = struct.pack(
-        "<4sIHHI",
-        MAGIC,
-        args.samplerate,
-        args.channels,
-        16,
-        args.block_frames,
-    )
+    header = stream_header(args)
 
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
         server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if not args.no_nodelay:
+            # Accepted sockets inherit TCP_NODELAY, so even the first send skips Nagle.
+            server.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         server.bind((args.host, args.port))
         server.listen(1)
         print(f"Escuchando en {args.host}:{args.port}")
 
+        if args.rt:
+            apply_realtime_priority(args.rt_cpu)
         while True:
             conn, addr = server.accept()
             print(f"Cliente conectado: {addr[0]}:{addr[1]}")
             try:
-                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-                configure_tcp_keepalive(conn)
-                conn.sendall(header)
+                configure_stream_socket(conn, not args.no_nodelay, args.sndbuf)
+                mulaw = args.codec == "mulaw"
                 silence_block = bytes(args.block_frames * args.channels * 2)
+                if mulaw:
+                    silence_block = bytes(pcm16_to_mulaw(silence_block))
+                block_bytes = len(silence_block)
                 idle_sleep = max(args.block_frames / float(args.samplerate), 0.01)
-                with mic.recorder(
-                    samplerate=args.samplerate,
-                    channels=args.channels,
-                    blocksize=None,
-                ) as rec:
-                    while True:
-                        # `record(None)` returns currently available frames; when
-                        # idle it can be empty. Send silence to keep connection
-                        # active during playback pauses and avoid app timeouts.
-                        try:
-                            data = rec.record(None)
-                        except Exception as exc:
-                            print(f"Capture warning: {exc}", file=sys.stderr)
-                            conn.sendall(silence_block)
-                            time.sleep(idle_sleep)
-                            continue
-                        if data is None or len(data) == 0:
-                            conn.sendall(silence_block)
-                            time.sleep(idle_sleep)
-                            continue
-                        conn.sendall(float_to_pcm16(data))
+                # The header rides along with the first audio block.
+                sender = _BackgroundSender(conn, header, 64 * block_bytes, block_bytes, args.coalesce)
+                try:
+                    with mic.recorder(
+                        samplerate=args.samplerate,
+                        channels=args.channels,
+                        blocksize=args.block_frames,
+                    ) as rec:
+                        while True:
+                            # `record(n)` blocks until n frames are captured; during
+                            # playback pauses soundcard >= 0.4.2 fills the gap with
+                            # zeros, so the app keeps receiving audio at a steady pace.
+                            try:
+                                data = rec.record(args.block_frames)
+                            except Exception as exc:
+                                print(f"Capture warning: {exc}", file=sys.stderr)
+                                data = None
+                            if data is None:
+                                sender.push(silence_block)
+                            elif mulaw:
+                                sender.push(pcm16_to_mulaw(pcm16_view(data)))
+                            else:
+                                sender.push(pcm16_view(data))
+                            if data is None:
+                                time.sleep(idle_sleep)
+                finally:
+                    sender.close()
             except (BrokenPipeError, ConnectionResetError, OSError):
                 print("Cliente desconectado")
             finally:
@@ -468,7 +960,11 @@ def stream_soundcard(args, mic) -> None:
                     pass
 
 
-def stream_mic_bridge(args, stop_event: threading.Event) -> None:
+def stream_mic_bridge(
+    args,
+    stop_event: threading.Event,
+    wakeup: socket.socket | None = None,
+) -> None:
     try:
         output_device = resolve_mic_output_device(args.mic_output_device)
     except RuntimeError as exc:
@@ -477,28 +973,39 @@ def stream_mic_bridge(args, stop_event: threading.Event) -> None:
 
     describe_output_device(output_device, "Mic bridge output")
 
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server, selectors.DefaultSelector() as selector:
         server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         server.bind((args.host, args.mic_port))
         server.listen(1)
-        server.settimeout(1.0)
+        server.setblocking(False)
+        selector.register(server, selectors.EVENT_READ)
+        # With a wakeup socket the idle accept loop sleeps until a client
+        # arrives or main() asks us to stop, instead of polling every second.
+        if wakeup is not None:
+            selector.register(wakeup, selectors.EVENT_READ)
+        accept_timeout = None if wakeup is not None else 1.0
         print(f"Mic bridge escuchando en {args.host}:{args.mic_port}")
 
         while not stop_event.is_set():
+            if not selector.select(timeout=accept_timeout) or stop_event.is_set():
+                continue
             try:
                 conn, addr = server.accept()
-            except TimeoutError:
+            except BlockingIOError:
                 continue
             print(f"Mic cliente conectado: {addr[0]}:{addr[1]}")
             try:
                 conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with contextlib.suppress(OSError):
+                    conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 2 * MIC_RECV_BUFFER)
                 configure_tcp_keepalive(conn)
                 conn.settimeout(1.0)
 
-                header = read_exact(conn, 16)
+                header = read_exact(conn, HEADER_STRUCT.size)
                 if header is None:
                     raise RuntimeError("Mic bridge sin encabezado")
-                magic, samplerate, channels, bits, block_frames = struct.unpack("<4sIHHI", header)
+                magic, samplerate, channels, bits, block_frames = HEADER_STRUCT.unpack(header)
                 if magic != MIC_MAGIC:
                     raise RuntimeError("Mic bridge encabezado invalido")
                 if bits != 16:
@@ -510,7 +1017,7 @@ def stream_mic_bridge(args, stop_event: threading.Event) -> None:
                 frame_size = input_channels * (bits // 8)
                 stream_block = block_frames if block_frames > 0 else 0
                 output_channels = input_channels
-                out_dev = sd.query_devices(output_device)
+                out_dev = cached_device(output_device)
                 max_out = int(out_dev["max_output_channels"])
                 if input_channels == 1 and max_out >= 2:
                     # Some virtual devices are more stable with stereo frames.
@@ -527,22 +1034,27 @@ def stream_mic_bridge(args, stop_event: threading.Event) -> None:
                     channels=output_channels,
                     device=output_device,
                 ) as out_stream:
-                    carry = b""
+                    buf = bytearray(MIC_RECV_BUFFER + frame_size)
+                    view = memoryview(buf)
+                    fill = 0
                     while not stop_event.is_set():
                         try:
-                            data = conn.recv(8192)
+                            received = conn.recv_into(view[fill:])
                         except TimeoutError:
                             continue
-                        if not data:
+                        if not received:
                             break
-                        payload = carry + data
-                        aligned = len(payload) - (len(payload) % frame_size)
+                        rearm_quickack(conn)
+                        fill += received
+                        aligned = fill - (fill % frame_size)
                         if aligned > 0:
-                            chunk = payload[:aligned]
+                            chunk = view[:aligned]
                             if input_channels == 1 and output_channels == 2:
                                 chunk = mono16_to_stereo(chunk)
                             out_stream.write(chunk)
-                        carry = payload[aligned:]
+                            # Keep the partial frame at the front for the next read.
+                            buf[: fill - aligned] = buf[aligned:fill]
+                            fill -= aligned
             except (BrokenPipeError, ConnectionResetError, OSError) as exc:
                 print(f"Mic cliente desconectado: {exc}")
             except Exception as exc:
@@ -564,6 +1076,50 @@ def main() -> int:
     parser.add_argument("--channels", type=int, default=DEFAULT_CHANNELS)
     parser.add_argument("--block-frames", type=int, default=DEFAULT_BLOCK_FRAMES)
     parser.add_argument("--mic-port", type=int, default=DEFAULT_MIC_PORT, help="Puerto TCP para mic bridge")
+    parser.add_argument(
+        "--send-batch",
+        type=int,
+        default=DEFAULT_SEND_BATCH,
+        help="Bloques pendientes maximos agrupados por envio (default 4).",
+    )
+    parser.add_argument(
+        "--sndbuf",
+        type=int,
+        default=DEFAULT_SEND_BUFFER,
+        help="SO_SNDBUF en bytes para el audio (0 = valor del sistema, default 131072).",
+    )
+    parser.add_argument(
+        "--coalesce",
+        type=int,
+        default=1,
+        help="Agrupa N bloques por segmento TCP con MSG_MORE (solo Linux, default 1).",
+    )
+    parser.add_argument(
+        "--no-nodelay",
+        action="store_true",
+        help="Desactiva TCP_NODELAY y deja que Nagle agrupe paquetes (LAN).",
+    )
+    parser.add_argument(
+        "--codec",
+        choices=["pcm16", "mulaw"],
+        default="pcm16",
+        help="Formato en la red: pcm16 o mulaw (G.711, mitad de ancho de banda; encabezado PCM2).",
+    )
+    parser.add_argument(
+        "--inline-send",
+        action="store_true",
+        help="Con un solo cliente, envia desde el callback de audio (menos latencia; sounddevice).",
+    )
+    parser.add_argument(
+        "--rt",
+        action="store_true",
+        help="Sube el hilo de envio a prioridad de tiempo real (SCHED_FIFO / TIME_CRITICAL).",
+    )
+    parser.add_argument(
+        "--rt-cpu",
+        type=int,
+        help="Fija el hilo de envio a esta CPU (implica --rt).",
+    )
     parser.add_argument(
         "--device",
         type=int,
@@ -606,6 +1162,14 @@ def main() -> int:
         help="Ruta del WAV de prueba (default: capture_test.wav).",
     )
     args = parser.parse_args()
+    args.send_batch = max(1, args.send_batch)
+    args.coalesce = max(1, args.coalesce)
+    if args.rt_cpu is not None:
+        if args.rt_cpu < 0:
+            parser.error("--rt-cpu debe ser un indice de CPU >= 0")
+        args.rt = True
+    if args.coalesce > 1 and not _MSG_MORE:
+        print("--coalesce requiere MSG_MORE (Linux); se ignora.", file=sys.stderr)
 
     backend = resolve_backend(args.backend)
     audio_enabled = args.audio_bridge == "on"
@@ -624,8 +1188,14 @@ def main() -> int:
         print("Nada que iniciar: audio_bridge=off y mic_bridge=off", file=sys.stderr)
         return 1
 
+    # Once, before any audio thread exists: the kernels share module-level
+    # scratch buffers, so warming them next to a running capture would race.
+    warm_up_pcm_kernels(args.block_frames, args.channels)
+
     mic_thread: threading.Thread | None = None
     mic_stop_event = threading.Event()
+    # Closing the write end wakes the mic bridge accept loop on shutdown.
+    mic_wake_r, mic_wake_w = socket.socketpair()
 
     def ensure_mic_bridge_started() -> None:
         nonlocal mic_thread
@@ -634,7 +1204,7 @@ def main() -> int:
         if mic_thread is None or not mic_thread.is_alive():
             mic_thread = threading.Thread(
                 target=stream_mic_bridge,
-                args=(args, mic_stop_event),
+                args=(args, mic_stop_event, mic_wake_r),
                 daemon=False,
             )
             mic_thread.start()
@@ -642,11 +1212,12 @@ def main() -> int:
     def hold_until_mic_stops() -> int:
         print("Audio deshabilitado. Mic bridge activo.")
         try:
-            while True:
-                if mic_thread is not None and not mic_thread.is_alive():
-                    print("Mic bridge finalizado")
-                    return 0
-                time.sleep(0.5)
+            # join() returns as soon as the bridge exits; the timeout only keeps
+            # Ctrl+C responsive on Windows, where an untimed join ignores it.
+            while mic_thread is not None and mic_thread.is_alive():
+                mic_thread.join(timeout=1.0)
+            print("Mic bridge finalizado")
+            return 0
         except KeyboardInterrupt:
             print("Detenido por usuario")
             return 0
@@ -697,9 +1268,11 @@ def main() -> int:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
     finally:
+        mic_stop_event.set()
+        mic_wake_w.close()
         if mic_thread is not None:
-            mic_stop_event.set()
             mic_thread.join(timeout=2.5)
+        mic_wake_r.close()
 
 
 if __name__ == "__main__":
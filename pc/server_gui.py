@@ -1,17 +1,31 @@
 import contextlib
+import functools
 import json
 import multiprocessing as mp
 import os
 import queue
+import re
 import shutil
+import signal
 import socket
 import subprocess
 import sys
-import tkinter as tk
-from tkinter import messagebox, ttk
-
-import server
-
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from multiprocessing import connection as mp_connection
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+
+# Spawned workers re-import this file (as __mp_main__, or the frozen exe with
+# --multiprocessing-fork) but only run the server; skip loading Tk there.
+if __name__ != "__mp_main__" and "--multiprocessing-fork" not in sys.argv:
+    import tkinter as tk
+    from tkinter import messagebox, ttk
+
+# Always spawn: forking would copy the GUI's Tk/Tcl state into every worker.
+_MP_CONTEXT = mp.get_context("spawn")
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "server_gui_config.json")
 DEFAULT_CONFIG = {
     "host": "0.0.0.0",
@@ -31,9 +45,35 @@ APP_DIR = os.path.dirname(os.path.abspath(__file__))
 if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
     APP_DIR = getattr(sys, "_MEIPASS")
 ICON_PATH = os.path.join(APP_DIR, "assets", "server_icon.ico")
+ICON_EXISTS = os.path.exists(ICON_PATH)
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 LOCAL_PROPERTIES_PATH = os.path.join(PROJECT_ROOT, "android", "local.properties")
 _ADB_EXECUTABLE: str | None = None
+_local_properties_cache: dict[str, object] = {"mtime": None, "value": None}
+_SDK_DIR_RE = re.compile(rb"^[ \t]*sdk\.dir=[ \t]*(\S[^\r\n]*?)[ \t\r]*$", re.MULTILINE)
+_ADB_MISS_AT: float | None = None  # time.monotonic() of the last failed lookup
+ADB_MISS_TTL = 5.0  # seconds before searching for adb again after a miss
+ADB_ENV_VARS = (
+    "ADB_PATH",
+    "SONARLINK_ADB",
+    "ANDROID_SDK_ROOT",
+    "ANDROID_HOME",
+    "LOCALAPPDATA",
+    "USERPROFILE",
+)
+ADB_EXE_TTL = 5.0  # seconds before re-checking that the resolved adb still exists
+_adb_exe_cache: dict[str, float] = {"expires": 0.0, "env_len": len(os.environ)}
+try:
+    ADB_SERVER_PORT = int(os.environ.get("ANDROID_ADB_SERVER_PORT") or 5037)
+except ValueError:
+    ADB_SERVER_PORT = 5037
+# "<serial>\tdevice" lines of `adb devices`; other states (offline, unauthorized) are skipped.
+_ADB_DEVICE_RE = re.compile(rb"^[ \t]*(\S+)\tdevice[ \t\r]*$", re.MULTILINE)
+ADB_DEVICES_TTL = 2.0  # seconds an `adb devices` result is reused
+_adb_devices_cache: dict[str, object] = {"ts": 0.0, "result": None}
+ADB_NOT_FOUND_MESSAGE = (
+    "No se encontro adb. Usa assets\\platform-tools\\adb.exe, instala Platform-Tools o define ADB_PATH."
+)
 if getattr(sys, "frozen", False):
     RUNTIME_DIR = os.path.dirname(os.path.abspath(sys.executable))
 else:
@@ -41,92 +81,242 @@ else:
 BUNDLED_PLATFORM_TOOLS = os.path.join(APP_DIR, "assets", "platform-tools")
 BUNDLED_DRIVER_DIR = os.path.join(APP_DIR, "assets", "driver")
 RUNTIME_DRIVER_DIR = os.path.join(RUNTIME_DIR, "assets", "driver")
+IP_CACHE_TTL = 5.0  # seconds
+_ip_cache: tuple[float, list[str]] | None = None
+STOP_GRACE_MS = 2500  # wait after Ctrl+C before killing the worker
+WORKER_MIN_UPTIME = 5.0  # seconds; a worker dying sooner counts as a failed start
+WORKER_RESPAWN_BASE_MS = 500
+WORKER_RESPAWN_MAX_MS = 30000
+LOG_MAX_LINES = 2000
+LOG_TRIM_SLACK = 500
+LOG_POLL_BUSY_MS = 50
+LOG_POLL_IDLE_MS = 250
+LOG_MAX_PENDING = 2000  # lines held in the worker while the GUI is not draining
+LOG_FLUSH_BYTES = 4096
+LOG_FLUSH_LINES = 32
+LOG_FLUSH_DELAY = 0.1  # seconds
 DRIVER_NAME_HINTS = (
     "vb-audio virtual cable",
     "cable input",
     "cable output",
     "virtual cable",
 )
+_DRIVER_NAME_RE = re.compile("|".join(map(re.escape, DRIVER_NAME_HINTS)))
+# Last _detect_virtual_cable result; invalidated after the driver install.
+_vcable_cache: tuple[bool, list[str], str | None] | None = None
+
+
+# (flag, config key) pairs always passed to server.main(), in argv order.
+_ARGV_OPTIONS = (
+    ("--host", "host"),
+    ("--port", "port"),
+    ("--backend", "backend"),
+    ("--audio-bridge", "audio_bridge"),
+    ("--samplerate", "samplerate"),
+    ("--channels", "channels"),
+    ("--block-frames", "block_frames"),
+    ("--mic-port", "mic_port"),
+    ("--mic-bridge", "mic_bridge"),
+)
 
 
-class _QueueWriter:
-    def __init__(self, log_queue: "mp.Queue[str]") -> None:
-        self._queue = log_queue
+class _PipeWriter:
+    # stdout/stderr replacement for the worker processes. Writers only append
+    # complete lines to a bounded in-memory batch; a daemon thread sends each
+    # batch as one raw UTF-8 message over a one-way pipe once it is large
+    # enough or LOG_FLUSH_DELAY after its first line. A stalled GUI therefore
+    # never blocks the audio threads that print: past LOG_MAX_PENDING lines the
+    # oldest are dropped and counted instead.
+    def __init__(self, log_conn: Connection) -> None:
+        self._conn = log_conn
+        self._ready = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._partial = ""
+        self._lines: list[str] = []
+        self._size = 0
+        self._dropped = 0
+        self._closed = False
+        self._thread: threading.Thread | None = None
 
     def write(self, text: str) -> None:
         if not text:
             return
-        cleaned = text.rstrip()
-        if cleaned:
-            self._queue.put(cleaned)
+        with self._ready:
+            if "\n" not in text:
+                # print() writes the message and its newline separately; just
+                # hold the text until the newline arrives.
+                self._partial += text
+                return
+            parts = (self._partial + text).split("\n")
+            self._partial = parts.pop()
+            for part in parts:
+                cleaned = part.rstrip()
+                if cleaned:
+                    self._lines.append(cleaned)
+                    self._size += len(cleaned) + 1
+            excess = len(self._lines) - LOG_MAX_PENDING
+            if excess > 0:
+                self._size -= sum(len(line) + 1 for line in self._lines[:excess])
+                del self._lines[:excess]
+                self._dropped += excess
+            if not self._lines:
+                return
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._ready.notify()
+
+    def send(self, line: str) -> None:
+        with self._send_lock:
+            with self._ready:
+                self._take_partial()
+                self._lines.append(line)
+                payload = self._take_batch()
+            self._send(payload)
 
     def flush(self) -> None:
-        return
-
-
-def _build_argv(config: dict[str, str]) -> list[str]:
-    argv = [
-        "server.py",
-        "--host",
-        config["host"],
-        "--port",
-        config["port"],
-        "--backend",
-        config["backend"],
-        "--audio-bridge",
-        config.get("audio_bridge", "on"),
-        "--samplerate",
-        config["samplerate"],
-        "--channels",
-        config["channels"],
-        "--block-frames",
-        config["block_frames"],
-        "--mic-port",
-        config["mic_port"],
-        "--mic-bridge",
-        config.get("mic_bridge", "on"),
-    ]
+        with self._send_lock:
+            with self._ready:
+                self._take_partial()
+                payload = self._take_batch()
+            self._send(payload)
+
+    def close(self) -> None:
+        # Stop the flusher thread so the warm worker does not keep one per run,
+        # then send whatever is still buffered.
+        with self._ready:
+            self._closed = True
+            self._ready.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+        self.flush()
+
+    def _take_partial(self) -> None:
+        cleaned = self._partial.rstrip()
+        self._partial = ""
+        if cleaned:
+            self._lines.append(cleaned)
+
+    def _take_batch(self) -> str:
+        lines = self._lines
+        if self._dropped:
+            lines.insert(0, f"[log] {self._dropped} lineas descartadas (GUI ocupada)")
+            self._dropped = 0
+        self._lines = []
+        self._size = 0
+        return "\n".join(lines)
+
+    def _send(self, payload: str) -> None:
+        if payload:
+            with contextlib.suppress(OSError):
+                self._conn.send_bytes(payload.encode("utf-8", "replace"))
+
+    def _run(self) -> None:
+        while True:
+            # Wait without the send lock, or an idle flusher would block
+            # every explicit send()/flush().
+            with self._ready:
+                while not self._lines and not self._closed:
+                    self._ready.wait()
+                if self._closed:
+                    return
+                if self._size < LOG_FLUSH_BYTES and len(self._lines) < LOG_FLUSH_LINES:
+                    self._ready.wait(LOG_FLUSH_DELAY)
+            # The send lock keeps batches in order with explicit flush()/send().
+            with self._send_lock:
+                with self._ready:
+                    payload = self._take_batch()
+                self._send(payload)
+
+
+def _build_argv(config: dict[str, str]) -> tuple[str, ...]:
+    argv = ["server.py"]
+    for flag, key in _ARGV_OPTIONS:
+        argv.extend((flag, config.get(key, DEFAULT_CONFIG[key])))
     device = config.get("device", "").strip()
     if device:
         argv.extend(["--device", device])
     mic_output_device = config.get("mic_output_device", "").strip()
     if mic_output_device:
         argv.extend(["--mic-output-device", mic_output_device])
-    return argv
+    return tuple(argv)
 
 
-def _run_server_worker(config: dict[str, str], log_queue: "mp.Queue[str]") -> None:
-    writer = _QueueWriter(log_queue)
-    argv = _build_argv(config)
-    old_argv = list(sys.argv)
-    sys.argv = argv
+def _run_server_worker(argv: tuple[str, ...], log_conn: Connection) -> None:
+    import server  # only the worker process needs the audio stack
+
+    writer = _PipeWriter(log_conn)
+    # The warm worker outlives this run, so sys.argv is restored afterwards.
+    old_argv = sys.argv
+    sys.argv = list(argv)
     try:
         with contextlib.redirect_stdout(writer), contextlib.redirect_stderr(writer):
             rc = server.main()
-        log_queue.put(f"[worker] finalizado con codigo {rc}")
+        writer.send(f"[worker] finalizado con codigo {rc}")
     except Exception as exc:  # pragma: no cover - subprocess safety
-        log_queue.put(f"[worker] error: {exc}")
+        writer.send(f"[worker] error: {exc}")
     finally:
         sys.argv = old_argv
+        writer.close()
+
 
+def _run_list_worker(backend: str, log_conn: Connection) -> None:
+    import server
 
-def _run_list_worker(backend: str, log_queue: "mp.Queue[str]") -> None:
-    writer = _QueueWriter(log_queue)
+    writer = _PipeWriter(log_conn)
     old_argv = list(sys.argv)
     try:
         with contextlib.redirect_stdout(writer), contextlib.redirect_stderr(writer):
             sys.argv = ["server.py", "--backend", backend, "--list"]
             server.main()
-            log_queue.put("--- salidas para Mic out dev ---")
+            writer.send("--- salidas para Mic out dev ---")
             sys.argv = ["server.py", "--list-outputs"]
             server.main()
     except Exception as exc:  # pragma: no cover - subprocess safety
-        log_queue.put(f"[list] error: {exc}")
+        writer.send(f"[list] error: {exc}")
     finally:
         sys.argv = old_argv
+        writer.close()
+
+
+def _run_command_worker(commands: Connection, log_conn: Connection) -> None:
+    # Long-lived worker: interpreter start-up and the audio imports are paid
+    # once, then each GUI command runs here and is acknowledged with
+    # ("done", command) so the process can take the next one.
+    with contextlib.suppress(Exception):
+        import server  # warm the audio stack before the first command
+    while True:
+        try:
+            command, payload = commands.recv()
+        except KeyboardInterrupt:
+            continue
+        except (EOFError, OSError):
+            return
+        try:
+            # Pick up devices plugged in or installed since the last command.
+            import server
+
+            server.reset_audio_devices()
+            if command == "start":
+                _run_server_worker(payload, log_conn)
+            elif command == "list":
+                _run_list_worker(payload, log_conn)
+        except KeyboardInterrupt:
+            pass
+        except Exception as exc:  # pragma: no cover - subprocess safety
+            _PipeWriter(log_conn).send(f"[worker] error: {exc}")
+        with contextlib.suppress(OSError):
+            commands.send(("done", command))
+
+
+def _detect_local_ips(use_cache: bool = True) -> list[str]:
+    global _ip_cache
 
+    now = time.monotonic()
+    if use_cache and _ip_cache is not None and now - _ip_cache[0] < IP_CACHE_TTL:
+        return list(_ip_cache[1])
 
-def _detect_local_ips() -> list[str]:
     ips: set[str] = set()
 
     try:
@@ -137,67 +327,109 @@ def _detect_local_ips() -> list[str]:
     except OSError:
         pass
 
-    # Fallback: detect outbound interface without sending real traffic.
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
-            probe.connect(("8.8.8.8", 80))
-            ip = probe.getsockname()[0]
-            if ip and not ip.startswith("127."):
-                ips.add(ip)
-    except OSError:
-        pass
+    # Fallback: detect outbound interface without sending real traffic. Only
+    # needed when the hostname lookup found no LAN address.
+    if not ips:
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+                probe.connect(("8.8.8.8", 80))
+                ip = probe.getsockname()[0]
+                if ip and not ip.startswith("127."):
+                    ips.add(ip)
+        except OSError:
+            pass
 
-    def key(ip: str) -> tuple[int, ...]:
+    def key(ip: str) -> bytes:
         try:
-            return tuple(int(part) for part in ip.split("."))
-        except ValueError:
-            return (999, 999, 999, 999)
+            return socket.inet_aton(ip)
+        except OSError:
+            return b"\xff\xff\xff\xff\xff"
 
-    return sorted(ips, key=key)
+    result = sorted(ips, key=key)
+    _ip_cache = (now, result)
+    return list(result)
 
 
 def _read_android_sdk_from_local_properties() -> str | None:
-    if not os.path.exists(LOCAL_PROPERTIES_PATH):
+    # Re-read only when the file changed; one stat replaces open + scan.
+    try:
+        mtime = os.stat(LOCAL_PROPERTIES_PATH).st_mtime_ns
+    except OSError:
         return None
+    if _local_properties_cache["mtime"] != mtime:
+        _local_properties_cache["value"] = _parse_local_properties_sdk()
+        _local_properties_cache["mtime"] = mtime
+    return _local_properties_cache["value"]
+
 
+def _parse_local_properties_sdk() -> str | None:
     try:
-        with open(LOCAL_PROPERTIES_PATH, "r", encoding="utf-8") as fh:
-            for line in fh:
-                cleaned = line.strip()
-                if not cleaned.startswith("sdk.dir="):
-                    continue
-                raw = cleaned.split("=", 1)[1].strip()
-                raw = raw.replace("\\:", ":").replace("\\\\", "\\")
-                if raw:
-                    return raw
+        with open(LOCAL_PROPERTIES_PATH, "rb") as fh:
+            data = fh.read()
     except OSError:
         return None
-    return None
+    match = _SDK_DIR_RE.search(data)
+    if match is None:
+        return None
+    raw = match.group(1).decode("utf-8", "replace")
+    return raw.replace("\\:", ":").replace("\\\\", "\\")
 
 
-def _candidate_adb_paths() -> list[str]:
-    candidates: list[str] = []
+def _list_files(directory: str) -> dict[str, str]:
+    # Lower-cased name -> path for the regular files in `directory`; one
+    # scandir replaces a stat per name we might look for.
+    files: dict[str, str] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    files[entry.name.lower()] = entry.path
+    except OSError:
+        pass
+    return files
+
+
+def _adb_in_dir(tools_dir: str) -> list[str]:
+    files = _list_files(os.path.expandvars(os.path.expanduser(tools_dir)))
+    return [files[name] for name in ("adb.exe", "adb") if name in files]
+
+
+def _dedup_paths(paths) -> tuple[str, ...]:
+    # Order-preserving and case-insensitive, like Windows paths; the first
+    # spelling of each path wins.
+    unique: dict[str, str] = {}
+    for path in paths:
+        normalized = os.path.normpath(path)
+        unique.setdefault(normalized.lower(), normalized)
+    return tuple(unique.values())
+
+
+def _iter_adb_candidates() -> Iterator[str]:
+    # Cheapest sources first and generated lazily, so a hit on the bundled
+    # copy or PATH never reads local.properties or lists the SDK folders.
+    environ = os.environ
+    env = {
+        name: environ[name].strip().strip('"') if name in environ else ""
+        for name in ADB_ENV_VARS
+    }
 
     # Prefer bundled platform-tools first.
-    candidates.append(os.path.join(BUNDLED_PLATFORM_TOOLS, "adb.exe"))
-    candidates.append(os.path.join(BUNDLED_PLATFORM_TOOLS, "adb"))
-    candidates.append(os.path.join(RUNTIME_DIR, "assets", "platform-tools", "adb.exe"))
-    candidates.append(os.path.join(RUNTIME_DIR, "assets", "platform-tools", "adb"))
-    candidates.append(os.path.join(RUNTIME_DIR, "platform-tools", "adb.exe"))
-    candidates.append(os.path.join(RUNTIME_DIR, "platform-tools", "adb"))
+    yield from _adb_in_dir(BUNDLED_PLATFORM_TOOLS)
+    yield from _adb_in_dir(os.path.join(RUNTIME_DIR, "assets", "platform-tools"))
+    yield from _adb_in_dir(os.path.join(RUNTIME_DIR, "platform-tools"))
 
     for env_name in ("ADB_PATH", "SONARLINK_ADB"):
-        env_value = os.environ.get(env_name, "").strip().strip('"')
+        env_value = env[env_name]
         if env_value:
-            candidates.append(env_value)
+            yield os.path.expandvars(os.path.expanduser(env_value))
 
     from_path = shutil.which("adb")
     if from_path:
-        candidates.append(from_path)
+        yield from_path
 
     sdk_roots: list[str] = []
     for env_name in ("ANDROID_SDK_ROOT", "ANDROID_HOME"):
-        value = os.environ.get(env_name, "").strip().strip('"')
+        value = env[env_name]
         if value:
             sdk_roots.append(value)
 
@@ -205,62 +437,74 @@ def _candidate_adb_paths() -> list[str]:
     if local_sdk:
         sdk_roots.append(local_sdk)
 
-    local_app_data = os.environ.get("LOCALAPPDATA", "").strip().strip('"')
+    local_app_data = env["LOCALAPPDATA"]
     if local_app_data:
         sdk_roots.append(os.path.join(local_app_data, "Android", "Sdk"))
 
-    user_profile = os.environ.get("USERPROFILE", "").strip().strip('"')
+    user_profile = env["USERPROFILE"]
     if user_profile:
         sdk_roots.append(os.path.join(user_profile, "AppData", "Local", "Android", "Sdk"))
 
-    for sdk_root in sdk_roots:
-        candidates.append(os.path.join(sdk_root, "platform-tools", "adb.exe"))
-        candidates.append(os.path.join(sdk_root, "platform-tools", "adb"))
+    for sdk_root in _dedup_paths(sdk_roots):
+        yield from _adb_in_dir(os.path.join(sdk_root, "platform-tools"))
 
-    # Preserve order, remove duplicates.
-    dedup: list[str] = []
-    seen: set[str] = set()
-    for candidate in candidates:
-        normalized = os.path.normpath(os.path.expandvars(os.path.expanduser(candidate)))
-        key = normalized.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        dedup.append(normalized)
-    return dedup
+
+def _invalidate_adb_cache() -> None:
+    global _ADB_EXECUTABLE, _ADB_MISS_AT
+    _ADB_EXECUTABLE = None
+    _ADB_MISS_AT = None
+    _adb_exe_cache["expires"] = 0.0
+    _adb_devices_cache["result"] = None
 
 
 def _resolve_adb_executable() -> str:
-    global _ADB_EXECUTABLE
+    global _ADB_EXECUTABLE, _ADB_MISS_AT
 
+    # A changed environment (e.g. ADB_PATH set) invalidates every cached answer.
+    if len(os.environ) != _adb_exe_cache["env_len"]:
+        _invalidate_adb_cache()
+        _adb_exe_cache["env_len"] = len(os.environ)
+
+    now = time.monotonic()
     if _ADB_EXECUTABLE:
-        if _ADB_EXECUTABLE.lower() == "adb":
+        # Bulk reverse calls reuse the answer without a stat per adb process.
+        if now < _adb_exe_cache["expires"]:
             return _ADB_EXECUTABLE
-        if os.path.exists(_ADB_EXECUTABLE):
+        if _ADB_EXECUTABLE.lower() == "adb" or os.path.exists(_ADB_EXECUTABLE):
+            _adb_exe_cache["expires"] = now + ADB_EXE_TTL
             return _ADB_EXECUTABLE
+    # A recent miss is remembered so repeated clicks do not re-stat every candidate.
+    if _ADB_MISS_AT is not None and time.monotonic() - _ADB_MISS_AT < ADB_MISS_TTL:
+        raise RuntimeError(ADB_NOT_FOUND_MESSAGE)
 
-    for candidate in _candidate_adb_paths():
+    seen: set[str] = set()
+    for candidate in _iter_adb_candidates():
+        key = os.path.normcase(os.path.normpath(candidate))
+        if key in seen:
+            continue
+        seen.add(key)
         if os.path.isfile(candidate):
             _ADB_EXECUTABLE = candidate
+            _adb_exe_cache["expires"] = now + ADB_EXE_TTL
             return candidate
 
     # Final PATH check.
     if shutil.which("adb"):
         _ADB_EXECUTABLE = "adb"
+        _adb_exe_cache["expires"] = now + ADB_EXE_TTL
         return "adb"
 
-    raise RuntimeError(
-        "No se encontro adb. Usa assets\\platform-tools\\adb.exe, instala Platform-Tools o define ADB_PATH."
-    )
+    _ADB_MISS_AT = time.monotonic()
+    raise RuntimeError(ADB_NOT_FOUND_MESSAGE)
 
 
-def _run_adb(args: list[str]) -> tuple[subprocess.CompletedProcess[str], str]:
+def _run_adb(args: list[str]) -> tuple[subprocess.CompletedProcess[bytes], str]:
+    # Output stays bytes; callers decode only what they show to the user.
     adb_exe = _resolve_adb_executable()
     try:
         proc = subprocess.run(
             [adb_exe, *args],
             capture_output=True,
-            text=True,
             timeout=12,
             check=False,
         )
@@ -269,37 +513,49 @@ def _run_adb(args: list[str]) -> tuple[subprocess.CompletedProcess[str], str]:
     return proc, adb_exe
 
 
+def _adb_detail(proc: subprocess.CompletedProcess[bytes]) -> str:
+    return (proc.stderr or proc.stdout or b"").decode("utf-8", "replace").strip()
+
+
+def _invalidate_virtual_cable_cache() -> None:
+    global _vcable_cache
+    _vcable_cache = None
+    # PortAudio keeps the device list from its last initialization.
+    sd = sys.modules.get("sounddevice")
+    if sd is not None:
+        with contextlib.suppress(Exception):
+            sd._terminate()
+            sd._initialize()
+
+
 def _detect_virtual_cable() -> tuple[bool, list[str], str | None]:
+    global _vcable_cache
+    if _vcable_cache is not None:
+        installed, found, err = _vcable_cache
+        return installed, list(found), err
+    result = _query_virtual_cable()
+    if result[2] is None:
+        _vcable_cache = (result[0], list(result[1]), None)
+    return result
+
+
+def _query_virtual_cable() -> tuple[bool, list[str], str | None]:
     try:
-        devices = server.sd.query_devices()
+        # sounddevice alone is enough here; `server` would also pull in numpy,
+        # soundcard and numba.
+        import sounddevice as sd
+    except Exception:  # pragma: no cover - optional dependency
+        return _query_virtual_cable_powershell()
+
+    try:
+        devices = sd.query_devices()
     except Exception:
-        ps_cmd = (
-            "Get-CimInstance Win32_SoundDevice | "
-            "Where-Object { $_.Name -match 'VB-Audio|Virtual Cable|CABLE Input|CABLE Output' } | "
-            "Select-Object -ExpandProperty Name"
-        )
+        # PortAudio can be briefly busy; one retry is far cheaper than
+        # spawning PowerShell.
         try:
-            proc = subprocess.run(
-                [
-                    "powershell",
-                    "-NoProfile",
-                    "-ExecutionPolicy",
-                    "Bypass",
-                    "-Command",
-                    ps_cmd,
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=10,
-            )
-        except Exception as exc:  # pragma: no cover - platform/runtime fallback
-            return False, [], str(exc)
-        if proc.returncode != 0:
-            detail = (proc.stderr or proc.stdout or "").strip()
-            return False, [], (detail or "No se pudo consultar dispositivos de audio.")
-        found_ps = [line.strip() for line in proc.stdout.splitlines() if line.strip()]
-        return bool(found_ps), found_ps, None
+            devices = sd.query_devices()
+        except Exception:
+            return _query_virtual_cable_powershell()
 
     found: list[str] = []
     seen: set[str] = set()
@@ -308,7 +564,7 @@ def _detect_virtual_cable() -> tuple[bool, list[str], str | None]:
         lowered = name.lower()
         if not name:
             continue
-        if not any(hint in lowered for hint in DRIVER_NAME_HINTS):
+        if _DRIVER_NAME_RE.search(lowered) is None:
             continue
         if lowered in seen:
             continue
@@ -317,7 +573,38 @@ def _detect_virtual_cable() -> tuple[bool, list[str], str | None]:
     return bool(found), found, None
 
 
-def _candidate_driver_installers() -> list[str]:
+def _query_virtual_cable_powershell() -> tuple[bool, list[str], str | None]:
+    ps_cmd = (
+        "Get-CimInstance Win32_SoundDevice | "
+        "Where-Object { $_.Name -match 'VB-Audio|Virtual Cable|CABLE Input|CABLE Output' } | "
+        "Select-Object -ExpandProperty Name"
+    )
+    try:
+        proc = subprocess.run(
+            [
+                "powershell",
+                "-NoProfile",
+                "-ExecutionPolicy",
+                "Bypass",
+                "-Command",
+                ps_cmd,
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=10,
+        )
+    except Exception as exc:  # pragma: no cover - platform/runtime fallback
+        return False, [], str(exc)
+    if proc.returncode != 0:
+        detail = (proc.stderr or proc.stdout or "").strip()
+        return False, [], (detail or "No se pudo consultar dispositivos de audio.")
+    found_ps = [line.strip() for line in proc.stdout.splitlines() if line.strip()]
+    return bool(found_ps), found_ps, None
+
+
+@functools.lru_cache(maxsize=1)
+def _candidate_driver_installers() -> tuple[str, ...]:
     names = ["VBCABLE_Setup_x64.exe", "VBCABLE_Setup.exe"]
     if sys.maxsize <= 2**32:
         names = list(reversed(names))
@@ -332,23 +619,18 @@ def _candidate_driver_installers() -> list[str]:
     for root in roots:
         for name in names:
             candidates.append(os.path.join(root, name))
-
-    dedup: list[str] = []
-    seen: set[str] = set()
-    for candidate in candidates:
-        normalized = os.path.normpath(candidate)
-        key = normalized.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        dedup.append(normalized)
-    return dedup
+    return _dedup_paths(candidates)
 
 
 def _resolve_driver_installer() -> str | None:
+    listings: dict[str, dict[str, str]] = {}
     for candidate in _candidate_driver_installers():
-        if os.path.isfile(candidate):
-            return candidate
+        root, name = os.path.split(candidate)
+        if root not in listings:
+            listings[root] = _list_files(root)
+        found = listings[root].get(name.lower())
+        if found:
+            return found
     return None
 
 
@@ -387,26 +669,68 @@ def _run_driver_installer(installer_path: str) -> None:
     raise RuntimeError(detail)
 
 
-def _list_adb_devices() -> tuple[list[str], str, str]:
+def _start_adb_server() -> None:
+    # Bring the adb daemon up ahead of time so the first USB click does not
+    # pay for it; a missing or broken adb is reported when actually used.
+    with contextlib.suppress(RuntimeError, subprocess.SubprocessError):
+        _run_adb(["start-server"])
+
+
+def _query_adb_server(command: str) -> bytes | None:
+    # Speaks the adb host protocol directly to a running daemon, which answers
+    # in a few ms without spawning adb.exe. None means "ask adb instead".
+    request = f"{len(command):04x}{command}".encode("ascii")
     try:
-        proc, adb_exe = _run_adb(["devices"])
-    except RuntimeError as exc:
-        raise RuntimeError(str(exc)) from exc
+        with socket.create_connection(("127.0.0.1", ADB_SERVER_PORT), timeout=1.0) as sock:
+            sock.sendall(request)
+            reply = b""
+            while len(reply) < 8:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    return None
+                reply += chunk
+            if reply[:4] != b"OKAY":
+                return None
+            length = int(reply[4:8], 16)
+            payload = reply[8:]
+            while len(payload) < length:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    return None
+                payload += chunk
+    except (OSError, ValueError):
+        return None
+    return payload[:length]
 
-    if proc.returncode != 0:
-        output = (proc.stderr or proc.stdout or "").strip()
-        raise RuntimeError(output or "adb devices fallo.")
-
-    serials: list[str] = []
-    lines = proc.stdout.splitlines()
-    for line in lines[1:]:
-        cleaned = line.strip()
-        if not cleaned:
-            continue
-        if cleaned.endswith("\tdevice"):
-            serials.append(cleaned.split("\t")[0])
 
-    return serials, proc.stdout.strip(), adb_exe
+def _list_adb_devices() -> tuple[list[str], str, str]:
+    now = time.monotonic()
+    cached = _adb_devices_cache["result"]
+    if cached is not None and now - _adb_devices_cache["ts"] < ADB_DEVICES_TTL:
+        return cached
+
+    listing = _query_adb_server("host:devices")
+    if listing is not None:
+        adb_exe = _resolve_adb_executable()
+        raw = b"List of devices attached\n" + listing
+    else:
+        try:
+            proc, adb_exe = _run_adb(["devices"])
+        except RuntimeError as exc:
+            raise RuntimeError(str(exc)) from exc
+
+        if proc.returncode != 0:
+            raise RuntimeError(_adb_detail(proc) or "adb devices fallo.")
+        raw = proc.stdout
+
+    serials = [serial.decode("utf-8", "replace") for serial in _ADB_DEVICE_RE.findall(raw)]
+
+    result = (serials, raw.decode("utf-8", "replace").strip(), adb_exe)
+    # Only a listing with phones is reused; after a miss the next click asks
+    # again, so a phone plugged in meanwhile shows up at once.
+    _adb_devices_cache["result"] = result if serials else None
+    _adb_devices_cache["ts"] = now
+    return result
 
 
 def _adb_reverse(serial: str, port: int, remove: bool) -> None:
@@ -424,50 +748,74 @@ def _adb_reverse(serial: str, port: int, remove: bool) -> None:
         raise RuntimeError(f"Fallo ejecutando adb reverse en {serial}: {exc}") from exc
 
     if proc.returncode != 0:
-        output = (proc.stderr or proc.stdout or "").strip()
+        output = _adb_detail(proc)
         if remove and "not found" in output.lower():
             # Ya no habia regla activa para ese dispositivo; no es error real.
             return
         raise RuntimeError(output or f"adb reverse fallo para {serial}.")
 
 
+def _adb_reverse_all(serials: list[str], ports: list[int], remove: bool) -> None:
+    # Each rule is its own adb process, so run them side by side and report
+    # every failure instead of stopping at the first one.
+    pairs = [(serial, port) for serial in serials for port in ports]
+    if not pairs:
+        return
+    errors: list[str] = []
+    with ThreadPoolExecutor(max_workers=len(pairs)) as pool:
+        futures = [pool.submit(_adb_reverse, serial, port, remove) for serial, port in pairs]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except RuntimeError as exc:
+                errors.append(str(exc))
+    if errors:
+        raise RuntimeError("\n".join(errors))
+
+
 class ServerGuiApp:
-    def __init__(self, root: tk.Tk) -> None:
+    def __init__(self, root: "tk.Tk") -> None:
         self.root = root
         self.root.title("SonarLink Server")
-        if os.path.exists(ICON_PATH):
+        if ICON_EXISTS:
             with contextlib.suppress(Exception):
                 self.root.iconbitmap(ICON_PATH)
         self.root.geometry("780x560")
         self.root.minsize(700, 480)
 
-        self.config_vars = {
-            "host": tk.StringVar(value=DEFAULT_CONFIG["host"]),
-            "port": tk.StringVar(value=DEFAULT_CONFIG["port"]),
-            "backend": tk.StringVar(value=DEFAULT_CONFIG["backend"]),
-            "audio_bridge": tk.StringVar(value=DEFAULT_CONFIG["audio_bridge"]),
-            "device": tk.StringVar(value=DEFAULT_CONFIG["device"]),
-            "mic_output_device": tk.StringVar(value=DEFAULT_CONFIG["mic_output_device"]),
-            "samplerate": tk.StringVar(value=DEFAULT_CONFIG["samplerate"]),
-            "channels": tk.StringVar(value=DEFAULT_CONFIG["channels"]),
-            "block_frames": tk.StringVar(value=DEFAULT_CONFIG["block_frames"]),
-            "mic_port": tk.StringVar(value=DEFAULT_CONFIG["mic_port"]),
-            "mic_bridge": tk.StringVar(value=DEFAULT_CONFIG["mic_bridge"]),
-        }
-
-        self.server_process: mp.Process | None = None
-        self.log_queue: "mp.Queue[str]" = mp.Queue()
+        self.config_vars = {key: tk.StringVar(value=value) for key, value in DEFAULT_CONFIG.items()}
+
+        self._last_valid_config: dict[str, str] | None = None
+        self._last_saved_bytes: bytes | None = None
+        self.worker: BaseProcess | None = None
+        self.worker_conn: Connection | None = None
+        self.worker_task: str | None = None
+        # Tk builds without file handlers (Windows) use a waiter thread instead.
+        self._file_events = hasattr(self.root.tk, "createfilehandler")
+        self._watched_fds: list[int] = []
+        # (resume, stopped, pipe_closed) events of the current waiter thread.
+        self._waiter: tuple[threading.Event, threading.Event, threading.Event] | None = None
+        self._worker_started_at = 0.0
+        self._respawn_failures = 0
+        self._server_run = 0
+        self.log_reader, self.log_sender = _MP_CONTEXT.Pipe(duplex=False)
+        self._pending_logs: list[str] = []
+        self._extra_log_readers: list[Connection] = []
         self.local_ips_var = tk.StringVar(value="Detectando...")
+        self.local_ips: list[str] = []
+        self._ip_results: "queue.Queue[list[str]]" = queue.Queue()
         self.usb_status_var = tk.StringVar(value="USB: inactivo")
 
         self._build_ui()
         self._load_config()
         self._refresh_local_ips()
 
+        threading.Thread(target=_start_adb_server, daemon=True).start()
+        self._spawn_worker()
+
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.root.after(700, self._check_driver_on_startup)
         self.root.after(120, self._poll_logs)
-        self.root.after(500, self._poll_process)
 
     def _build_ui(self) -> None:
         self.root.columnconfigure(0, weight=1)
@@ -578,6 +926,7 @@ class ServerGuiApp:
         usb_frame.columnconfigure(0, weight=1)
         usb_frame.columnconfigure(1, weight=0)
         usb_frame.columnconfigure(2, weight=0)
+        usb_frame.columnconfigure(3, weight=0)
 
         ttk.Label(usb_frame, textvariable=self.usb_status_var).grid(
             row=0,
@@ -594,6 +943,12 @@ class ServerGuiApp:
             row=0,
             column=2,
             sticky="ew",
+            padx=(0, 8),
+        )
+        ttk.Button(usb_frame, text="Refrescar ADB", command=self._refresh_adb).grid(
+            row=0,
+            column=3,
+            sticky="ew",
         )
 
         log_frame = ttk.LabelFrame(self.root, text="Logs", padding=10)
@@ -613,12 +968,18 @@ class ServerGuiApp:
         self._append_log("Wi-Fi: usa una IP mostrada arriba y el puerto configurado.")
         self._append_log("USB: activa 'ADB reverse' y en Android usa host 127.0.0.1.")
 
-    def _add_field(self, parent: ttk.Frame, label: str, key: str, row: int, col: int) -> None:
+    def _add_field(self, parent: "ttk.Frame", label: str, key: str, row: int, col: int) -> None:
         ttk.Label(parent, text=label).grid(row=row, column=col, sticky="w", padx=6)
         ttk.Entry(parent, textvariable=self.config_vars[key]).grid(row=row + 1, column=col, sticky="ew", padx=6)
 
+    def _current_config(self) -> dict[str, str]:
+        return {k: v.get().strip() for k, v in self.config_vars.items()}
+
     def _validate_config(self) -> dict[str, str] | None:
-        cfg = {k: v.get().strip() for k, v in self.config_vars.items()}
+        cfg = self._current_config()
+        # Unchanged since the last successful validation: nothing to re-check.
+        if cfg == self._last_valid_config:
+            return dict(cfg)
         if not cfg["host"]:
             messagebox.showerror("Config", "Host es obligatorio")
             return None
@@ -669,47 +1030,205 @@ class ServerGuiApp:
             messagebox.showerror("Config", "audio_bridge debe ser on/off")
             return None
 
+        self._last_valid_config = dict(cfg)
         return cfg
 
+    def _spawn_worker(self) -> None:
+        self.worker_conn, child_conn = _MP_CONTEXT.Pipe()
+        self.worker = _MP_CONTEXT.Process(
+            target=_run_command_worker,
+            args=(child_conn, self.log_sender),
+            daemon=True,
+        )
+        self.worker.start()
+        child_conn.close()
+        self.worker_task = None
+        self._worker_started_at = time.monotonic()
+        self._watch_worker()
+
+    def _watch_worker(self) -> None:
+        # Let Tk wake us when the worker exits or replies instead of polling.
+        if not self._file_events:
+            self._waiter = (threading.Event(), threading.Event(), threading.Event())
+            threading.Thread(
+                target=self._wait_for_worker,
+                args=(self.worker, self.worker_conn, *self._waiter),
+                daemon=True,
+            ).start()
+            return
+        for fd in (self.worker.sentinel, self.worker_conn.fileno()):
+            self.root.tk.createfilehandler(fd, tk.READABLE, self._on_worker_event)
+            self._watched_fds.append(fd)
+
+    def _wait_for_worker(
+        self,
+        proc: BaseProcess,
+        conn: Connection,
+        resume: threading.Event,
+        stopped: threading.Event,
+        pipe_closed: threading.Event,
+    ) -> None:
+        # Blocks until the worker exits or replies, then lets the Tk thread
+        # handle it; `resume` is set once that pass has drained the pipe.
+        while not stopped.is_set():
+            handles = [proc.sentinel] if pipe_closed.is_set() else [proc.sentinel, conn]
+            try:
+                ready = mp_connection.wait(handles)
+            except (OSError, ValueError):
+                return
+            if stopped.is_set():
+                return
+            if proc.sentinel in ready:
+                # Reap it here so is_alive() is already False on the Tk side.
+                proc.join(timeout=1)
+            resume.clear()
+            try:
+                self.root.after(0, self._check_worker)
+            except RuntimeError:
+                return  # Tk is gone
+            if proc.sentinel in ready:
+                return
+            resume.wait()
+
+    def _unwatch_worker(self, fd: int | None = None) -> None:
+        for watched in list(self._watched_fds):
+            if fd is None or watched == fd:
+                self.root.tk.deletefilehandler(watched)
+                self._watched_fds.remove(watched)
+        if self._waiter is not None:
+            resume, stopped, pipe_closed = self._waiter
+            if fd is None:
+                stopped.set()
+                self._waiter = None
+            else:
+                pipe_closed.set()
+            resume.set()
+
+    def _on_worker_event(self, fd: int, _mask: int) -> None:
+        if self.worker is not None and fd == self.worker.sentinel:
+            # The sentinel turns readable a few ms before the child can be
+            # reaped; wait for it instead of spinning on the event.
+            self.worker.join(timeout=1)
+        self._check_worker()
+
+    def _respawn_worker(self) -> None:
+        # Delayed respawn; the user may already have started a new worker.
+        if self.worker is None:
+            self._spawn_worker()
+
+    def _send_command(self, command: str, payload: object) -> bool:
+        try:
+            self.worker_conn.send((command, payload))
+            return True
+        except OSError:
+            pass
+        # The worker died between the liveness check and the send: replace it once.
+        self._kill_worker()
+        self._spawn_worker()
+        try:
+            self.worker_conn.send((command, payload))
+            return True
+        except OSError as exc:
+            self._append_log(f"No se pudo comunicar con el proceso de trabajo: {exc}")
+            return False
+
+    def _kill_worker(self) -> None:
+        self._unwatch_worker()
+        proc = self.worker
+        if proc is not None and proc.is_alive():
+            proc.terminate()
+            proc.join(timeout=2)
+            if proc.is_alive():
+                proc.kill()
+                proc.join(timeout=1)
+        if self.worker_conn is not None:
+            self.worker_conn.close()
+
     def _start_server(self) -> None:
-        if self.server_process is not None and self.server_process.is_alive():
+        if self.worker_task == "start":
             return
 
         cfg = self._validate_config()
         if cfg is None:
             return
 
-        self._save_config(show_message=False)
-        self.server_process = mp.Process(target=_run_server_worker, args=(cfg, self.log_queue), daemon=True)
-        self.server_process.start()
+        self._save_config(show_message=False, config=cfg)
+        if self.worker is None or self.worker_task is not None or not self.worker.is_alive():
+            # Busy with a device listing or gone: replace it rather than wait.
+            self._kill_worker()
+            self._spawn_worker()
+        # Ship the finished argv, not the config dict: smaller pickle, no
+        # rebuilding in the worker.
+        if not self._send_command("start", _build_argv(cfg)):
+            return
+        self.worker_task = "start"
+        self._server_run += 1
 
         self._append_log("Iniciando servidor...")
         self.start_button.configure(state="disabled")
         self.stop_button.configure(state="normal")
 
     def _stop_server(self) -> None:
-        proc = self.server_process
-        if proc is None:
+        if self.worker_task != "start":
             return
-        if proc.is_alive():
-            proc.terminate()
-            proc.join(timeout=2)
-            if proc.is_alive():
-                proc.kill()
-                proc.join(timeout=1)
-        self.server_process = None
-        self._append_log("Servidor detenido")
+        if os.name != "nt" and self.worker.is_alive():
+            # server.main() handles Ctrl+C and returns, which keeps the warm
+            # worker; Windows has no per-process Ctrl+C, so it is replaced.
+            os.kill(self.worker.pid, signal.SIGINT)
+            self._append_log("Deteniendo servidor...")
+            self.stop_button.configure(state="disabled")
+            run = self._server_run
+            self.root.after(STOP_GRACE_MS, lambda: self._force_stop_server(run))
+            return
+        self._force_stop_server(self._server_run)
+
+    def _force_stop_server(self, run: int) -> None:
+        if self.worker_task != "start" or run != self._server_run:
+            return
+        self._kill_worker()
+        self._spawn_worker()
+        self._server_stopped("Servidor detenido")
+
+    def _server_stopped(self, message: str) -> None:
+        self.worker_task = None
+        self._append_log(message)
         self.start_button.configure(state="normal")
         self.stop_button.configure(state="disabled")
 
     def _list_devices(self) -> None:
         backend = self.config_vars["backend"].get().strip() or "auto"
         self._append_log(f"Listando dispositivos ({backend})...")
-        proc = mp.Process(target=_run_list_worker, args=(backend, self.log_queue), daemon=True)
+        if self.worker is not None and self.worker_task is None and self.worker.is_alive():
+            if self._send_command("list", backend):
+                self.worker_task = "list"
+                return
+        # The warm worker is running the server: list from a one-off process.
+        # It gets its own pipe, since two writers on one pipe can interleave
+        # their frames.
+        reader, sender = _MP_CONTEXT.Pipe(duplex=False)
+        proc = _MP_CONTEXT.Process(target=_run_list_worker, args=(backend, sender), daemon=True)
         proc.start()
+        sender.close()
+        self._extra_log_readers.append(reader)
 
     def _refresh_local_ips(self) -> None:
-        ips = _detect_local_ips()
+        # getaddrinfo can stall for seconds on a broken network; keep Tk responsive.
+        if not self.local_ips:
+            self.local_ips_var.set("Detectando...")
+        threading.Thread(
+            target=lambda: self._ip_results.put(_detect_local_ips(use_cache=False)),
+            daemon=True,
+        ).start()
+        self.root.after(50, self._poll_local_ips)
+
+    def _poll_local_ips(self) -> None:
+        try:
+            ips = self._ip_results.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_local_ips)
+            return
+        # Kept in memory only; the start and close saves persist it as last_ips.
+        self.local_ips = ips
         if ips:
             self.local_ips_var.set(" | ".join(ips))
             self._append_log(f"IPs detectadas: {', '.join(ips)}")
@@ -718,7 +1237,8 @@ class ServerGuiApp:
             self._append_log("No se detectaron IPs LAN. Puedes usar modo USB con ADB.")
 
     def _copy_primary_ip(self) -> None:
-        ips = _detect_local_ips()
+        # Copy what the panel shows; only detect again if nothing was found.
+        ips = self.local_ips or _detect_local_ips()
         if not ips:
             messagebox.showwarning("IP", "No hay IP de red local para copiar.")
             return
@@ -767,6 +1287,7 @@ class ServerGuiApp:
             messagebox.showerror("Driver VB-CABLE", f"No se pudo instalar VB-CABLE:\n{exc}")
             return
 
+        _invalidate_virtual_cable_cache()
         installed_after, devices_after, err_after = _detect_virtual_cable()
         if installed_after:
             self._append_log(f"VB-CABLE instalado: {', '.join(devices_after)}")
@@ -832,9 +1353,7 @@ class ServerGuiApp:
                 self._append_log("ADB devices sin telefonos en estado 'device'.")
                 self._append_log(raw)
                 return
-            for serial in serials:
-                for port in ports:
-                    _adb_reverse(serial, port, remove=False)
+            _adb_reverse_all(serials, ports, remove=False)
             self.usb_status_var.set(f"USB activo: 127.0.0.1:{ports[0]}")
             self._append_log(f"ADB detectado: {adb_exe}")
             self._append_log(
@@ -857,9 +1376,7 @@ class ServerGuiApp:
                 self._append_log("ADB devices sin telefonos en estado 'device'.")
                 self._append_log(raw)
                 return
-            for serial in serials:
-                for port in ports:
-                    _adb_reverse(serial, port, remove=True)
+            _adb_reverse_all(serials, ports, remove=True)
             self.usb_status_var.set("USB: inactivo")
             self._append_log(f"ADB detectado: {adb_exe}")
             self._append_log(
@@ -870,36 +1387,123 @@ class ServerGuiApp:
             messagebox.showerror("USB", str(exc))
             self._append_log(f"Error USB: {exc}")
 
+    def _refresh_adb(self) -> None:
+        _invalidate_adb_cache()
+        try:
+            adb_exe = _resolve_adb_executable()
+        except RuntimeError as exc:
+            self.usb_status_var.set("USB: adb no encontrado")
+            self._append_log(f"Error USB: {exc}")
+            return
+        self._append_log(f"ADB detectado: {adb_exe}")
+
     def _append_log(self, message: str) -> None:
+        # GUI-side messages often come in runs (startup hints, USB results);
+        # queue them and render the run with one insert once Tk goes idle.
+        if not self._pending_logs:
+            self.root.after_idle(self._flush_pending_logs)
+        self._pending_logs.append(message)
+
+    def _flush_pending_logs(self) -> None:
+        messages = self._pending_logs
+        self._pending_logs = []
+        self._append_logs(messages)
+
+    def _append_logs(self, messages: list[str]) -> None:
+        # One insert per batch keeps Tcl round-trips constant per poll.
+        if not messages:
+            return
         self.log_text.configure(state="normal")
-        self.log_text.insert("end", message + "\n")
+        self.log_text.insert("end", "\n".join(messages) + "\n")
+        # Keep only the newest LOG_MAX_LINES so long sessions stay cheap to redraw;
+        # trimming waits for LOG_TRIM_SLACK extra lines so it is not per insert.
+        lines = int(self.log_text.index("end-1c").split(".")[0]) - 1
+        if lines > LOG_MAX_LINES + LOG_TRIM_SLACK:
+            self.log_text.delete("1.0", f"{lines - LOG_MAX_LINES + 1}.0")
         self.log_text.see("end")
         self.log_text.configure(state="disabled")
 
     def _poll_logs(self) -> None:
+        # Queued GUI messages go first so they keep their order with worker output.
+        pending = self._pending_logs
+        self._pending_logs = []
+        queued = len(pending)
         try:
-            while True:
-                msg = self.log_queue.get_nowait()
-                self._append_log(msg)
-        except queue.Empty:
+            while self.log_reader.poll(0):
+                # Each message is a batch of lines from one worker write burst.
+                pending.append(self.log_reader.recv_bytes().decode("utf-8", "replace"))
+        except (EOFError, OSError):
             pass
-        self.root.after(120, self._poll_logs)
-
-    def _poll_process(self) -> None:
-        proc = self.server_process
+        for reader in list(self._extra_log_readers):
+            try:
+                while reader.poll(0):
+                    pending.append(reader.recv_bytes().decode("utf-8", "replace"))
+            except (EOFError, OSError):
+                # The one-off process exited and its pipe is drained.
+                reader.close()
+                self._extra_log_readers.remove(reader)
+        self._append_logs(pending)
+        # Poll quickly while a worker is chatty and back off when idle.
+        busy = len(pending) > queued
+        self.root.after(LOG_POLL_BUSY_MS if busy else LOG_POLL_IDLE_MS, self._poll_logs)
+
+    def _check_worker(self) -> None:
+        proc = self.worker
         if proc is not None and not proc.is_alive():
             code = proc.exitcode
-            self.server_process = None
-            self.start_button.configure(state="normal")
-            self.stop_button.configure(state="disabled")
-            self._append_log(f"Servidor finalizado (exit={code})")
-        self.root.after(500, self._poll_process)
-
-    def _save_config(self, show_message: bool = True) -> None:
-        cfg = {k: v.get().strip() for k, v in self.config_vars.items()}
+            task = self.worker_task
+            self._unwatch_worker()
+            self.worker_conn.close()
+            self.worker = None
+            self.worker_conn = None
+            # A worker that dies right after spawning (e.g. a broken install)
+            # is retried with a growing delay instead of in a tight loop.
+            if time.monotonic() - self._worker_started_at < WORKER_MIN_UPTIME:
+                self._respawn_failures += 1
+            else:
+                self._respawn_failures = 0
+            if task == "start":
+                self._server_stopped(f"Servidor finalizado (exit={code})")
+            if self._respawn_failures:
+                delay = min(WORKER_RESPAWN_MAX_MS, WORKER_RESPAWN_BASE_MS * 2 ** (self._respawn_failures - 1))
+                self._append_log(
+                    f"El proceso de trabajo termino al iniciar (exit={code}); "
+                    f"reintentando en {delay / 1000:.1f} s."
+                )
+                self.root.after(delay, self._respawn_worker)
+            else:
+                self._spawn_worker()
+        elif self.worker_conn is not None:
+            try:
+                while self.worker_conn.poll(0):
+                    _done, task = self.worker_conn.recv()
+                    if task == "start":
+                        self._server_stopped("Servidor finalizado")
+                    elif task == self.worker_task:
+                        self.worker_task = None
+            except (EOFError, OSError):
+                # The worker is exiting; its sentinel reports the rest, so
+                # stop watching the closed pipe or Tk would fire on it forever.
+                with contextlib.suppress(OSError):
+                    self._unwatch_worker(self.worker_conn.fileno())
+            if self._waiter is not None:
+                self._waiter[0].set()
+
+    def _save_config(self, show_message: bool = True, config: dict[str, str] | None = None) -> None:
+        # Callers that already read the StringVars pass them in to skip the Tcl round-trips.
+        if config is None:
+            config = self._current_config()
+        cfg: dict[str, object] = {**config, "last_ips": list(self.local_ips)}
+        data = json.dumps(cfg, indent=2).encode("utf-8")
+        if not show_message and data == self._last_saved_bytes:
+            return
         try:
-            with open(CONFIG_PATH, "w", encoding="utf-8") as fh:
-                json.dump(cfg, fh, indent=2)
+            # Write a sibling file and swap it in, so a crash never leaves half a config.
+            tmp_path = CONFIG_PATH + ".tmp"
+            with open(tmp_path, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_path, CONFIG_PATH)
+            self._last_saved_bytes = data
             if show_message:
                 messagebox.showinfo("Config", "Configuracion guardada")
         except OSError as exc:
@@ -909,18 +1513,26 @@ class ServerGuiApp:
         if not os.path.exists(CONFIG_PATH):
             return
         try:
-            with open(CONFIG_PATH, "r", encoding="utf-8") as fh:
-                cfg = json.load(fh)
-        except (OSError, json.JSONDecodeError):
+            with open(CONFIG_PATH, "rb") as fh:
+                data = fh.read()
+            cfg = json.loads(data.decode("utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
             return
+        self._last_saved_bytes = data
 
         for key, var in self.config_vars.items():
             if key in cfg:
                 var.set(str(cfg[key]))
 
+        # Show the last known IPs right away; _refresh_local_ips revalidates them.
+        last_ips = cfg.get("last_ips")
+        if isinstance(last_ips, list) and last_ips:
+            self.local_ips = [str(ip) for ip in last_ips]
+            self.local_ips_var.set(" | ".join(self.local_ips))
+
     def _on_close(self) -> None:
         self._save_config(show_message=False)
-        self._stop_server()
+        self._kill_worker()
         self.root.destroy()
 
 